@@ -4,16 +4,190 @@ This module handles reading and writing JSON configuration files,
 creating backups of disabled tools, and restoring tools from backups.
 """
 
+import copy
 import json
 import os
 import logging
+import mmap
+import re
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from stat import S_IMODE
+from typing import Dict, Any, Optional, Set, Tuple, Union
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Encoder used when orjson isn't available. It is built once and writes
+# non-ASCII characters as UTF-8, like orjson does. Configs are trees of
+# plain JSON values, so the circular reference check isn't needed.
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False, separators=(',', ': '))
+
+# Files larger than this are memory-mapped when parsed with orjson
+_MMAP_THRESHOLD = 256 * 1024
+
+# Contents of a newly created configuration file
+EMPTY_CONFIG_JSON = b'{"mcpServers": {}}'
+
+# A JSON document that is an object, allowing for leading whitespace
+_OBJECT_START = re.compile(r'\s*\{')
+
+
+def _file_stat(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) pair used to key the parse caches.
+
+    Args:
+        path: Path of the file to stat
+
+    Returns:
+        The stat key, or None if the file doesn't exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Both parsers raise a subclass of json.JSONDecodeError on invalid input.
+
+    Args:
+        data: The JSON document, as bytes or str
+
+    Returns:
+        The parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path: str, size: int) -> Tuple[Any, Optional[bytes]]:
+    """Read and parse a JSON file.
+
+    Large files are memory-mapped and handed to orjson without copying them
+    into a Python bytes object first. The standard library parser can't read
+    from a mapping, so without orjson the file is always read normally.
+
+    Args:
+        path: Path of the file to read
+        size: Size of the file in bytes
+
+    Returns:
+        The parsed value, and the file's contents unless it was memory-mapped
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view), None
+        data = f.read()
+        return _loads(data), data
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a configuration dictionary to indented JSON bytes.
+
+    Args:
+        data: The dictionary to serialize
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return _ENCODER.encode(data).encode('utf-8')
+
+
+def _write_atomic(path: str, data: bytes, mode_from: Optional[str] = None) -> None:
+    """Write a file so that readers see either the old or the new contents.
+
+    The data is written and synced to a temporary file next to the target,
+    which is then renamed over it. A symlinked target is followed, so the
+    link is kept and the file it points to is updated, and an existing
+    file's permissions are kept, as configs may hold secrets.
+
+    Args:
+        path: Path of the file to write
+        data: The bytes to write
+        mode_from: File whose permissions a newly created file gets,
+                   instead of the defaults from the umask
+    """
+    path = os.path.realpath(path)
+    mode: Optional[int] = None
+    for mode_path in (path, mode_from):
+        if mode_path is None:
+            continue
+        try:
+            mode = S_IMODE(os.stat(mode_path).st_mode)
+            break
+        except FileNotFoundError:
+            pass
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            # Restrict the file before any of the data is in it
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temporary file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Optional tool properties and the type each must have if present
+_OPTIONAL_PROPERTIES = (
+    ("args", list, "an array"),
+    ("env", dict, "an object"),
+)
+
+# Marks a property that is absent, as opposed to present with a null value
+_MISSING = object()
+
+
+def _validate_servers(servers: Dict[str, Any]) -> Optional[str]:
+    """Check the structure of each tool in an 'mcpServers' object.
+
+    Args:
+        servers: The 'mcpServers' object to check
+
+    Returns:
+        An error message for the first invalid tool, None if all are valid
+    """
+    for tool_name, tool_config in servers.items():
+        if not isinstance(tool_config, dict):
+            return f"Tool '{tool_name}' configuration must be an object"
+
+        command = tool_config.get("command", _MISSING)
+        if command is _MISSING:
+            return f"Tool '{tool_name}' must have a 'command' property"
+
+        if not isinstance(command, str):
+            return f"Tool '{tool_name}' 'command' must be a string"
+
+        for key, expected_type, description in _OPTIONAL_PROPERTIES:
+            value = tool_config.get(key, _MISSING)
+            if value is not _MISSING and not isinstance(value, expected_type):
+                return f"Tool '{tool_name}' '{key}' must be {description}"
+
+    return None
+
 
 class ConfigManager:
     """Manages the MCP server tool configuration files."""
@@ -28,7 +202,52 @@ class ConfigManager:
         """
         self.config_path = config_path
         self.backup_path = backup_path or f"{config_path}.backup"
-        
+
+        # Resolve the parent directories once; they are created on first write
+        self._config_dir = os.path.dirname(os.path.abspath(self.config_path))
+        self._backup_dir = os.path.dirname(os.path.abspath(self.backup_path))
+        self._created_dirs: Set[str] = set()
+
+        # File contents, keyed by the (mtime_ns, size) they were read at. The
+        # config is kept as JSON bytes, so every read parses a fresh tree the
+        # caller may modify; that is much cheaper than deep-copying one.
+        self._config_cache: Optional[bytes] = None
+        self._config_stat: Optional[Tuple[int, int]] = None
+        self._backup_cache: Optional[Dict[str, Any]] = None
+        self._backup_stat: Optional[Tuple[int, int]] = None
+        # Whether the cached backup has changes not yet written to disk
+        self._backup_dirty = False
+
+    def invalidate(self) -> None:
+        """Drop the cached file contents so the next read goes to disk.
+
+        Call this when the files may have been changed by another program.
+        Pending backup changes are written out first.
+        """
+        self.flush_backup()
+        self._config_cache = None
+        self._config_stat = None
+        self._backup_cache = None
+        self._backup_stat = None
+
+    def _ensure_dir(self, directory: str) -> None:
+        """Create a directory if this instance hasn't already done so.
+
+        Args:
+            directory: The directory to create
+        """
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def config_stat(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the configuration file.
+
+        Returns:
+            A (mtime_ns, size) tuple, or None if the file doesn't exist
+        """
+        return _file_stat(self.config_path)
+
     def read_config(self) -> Dict[str, Any]:
         """Read the configuration file.
 
@@ -40,17 +259,23 @@ class ConfigManager:
             json.JSONDecodeError: If the configuration file contains invalid JSON
         """
         try:
-            if not os.path.exists(self.config_path):
+            stat = _file_stat(self.config_path)
+            if stat is None:
                 logger.warning(f"Configuration file not found: {self.config_path}")
                 return {"mcpServers": {}}
-                
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+
+            if self._config_cache is not None and stat == self._config_stat:
+                config = _loads(self._config_cache)
+            else:
+                # A memory-mapped file leaves nothing to cache; it is parsed
+                # straight from the mapping again next time
+                config, self._config_cache = _read_json_file(self.config_path, stat[1])
+                self._config_stat = stat
                 
             # Ensure the config has the expected structure
             if "mcpServers" not in config:
                 config["mcpServers"] = {}
-                
+
             return config
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in configuration file: {e}")
@@ -71,12 +296,16 @@ class ConfigManager:
         """
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(self.config_path)), exist_ok=True)
+            self._ensure_dir(self._config_dir)
             
-            with open(self.config_path, 'w') as f:
-                json.dump(config, f, indent=2)
-                
-            logger.info(f"Configuration written to {self.config_path}")
+            data = _dumps(config)
+            _write_atomic(self.config_path, data)
+
+            # Keep the written bytes so the next read doesn't go to disk
+            self._config_cache = data
+            self._config_stat = _file_stat(self.config_path)
+
+            logger.debug("Configuration written to %s", self.config_path)
         except (PermissionError, OSError) as e:
             logger.error(f"Error writing configuration file: {e}")
             raise
@@ -87,18 +316,47 @@ class ConfigManager:
         Returns:
             The backup configuration as a dictionary
         """
+        return copy.deepcopy(self._get_backup_cached())
+
+    def _get_backup_cached(self) -> Dict[str, Any]:
+        """Get the backup configuration, reading the file only if it changed.
+
+        The returned dictionary is the cache itself. Callers that modify it
+        must set _backup_dirty so flush_backup() writes it out.
+
+        Returns:
+            The cached backup configuration
+        """
+        # Unflushed changes are newer than whatever is on disk
+        if self._backup_dirty and self._backup_cache is not None:
+            return self._backup_cache
+
+        stat = _file_stat(self.backup_path)
+        if self._backup_cache is None or stat != self._backup_stat:
+            self._backup_cache = self._load_backup(stat)
+            self._backup_stat = stat
+        return self._backup_cache
+
+    def _load_backup(self, stat: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+        """Read and parse the backup file.
+
+        Args:
+            stat: The stat key of the backup file, None if it doesn't exist
+
+        Returns:
+            The backup configuration, empty if it can't be read
+        """
         try:
-            if not os.path.exists(self.backup_path):
-                logger.info(f"Backup file not found: {self.backup_path}")
+            if stat is None:
+                logger.debug("Backup file not found: %s", self.backup_path)
                 return {"mcpServers": {}}
-                
-            with open(self.backup_path, 'r') as f:
-                backup = json.load(f)
+
+            backup, _ = _read_json_file(self.backup_path, stat[1])
                 
             # Ensure the backup has the expected structure
             if "mcpServers" not in backup:
                 backup["mcpServers"] = {}
-                
+
             return backup
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in backup file: {e}")
@@ -113,54 +371,81 @@ class ConfigManager:
         Args:
             backup: The backup configuration dictionary to write
         """
+        if self._write_backup_file(backup):
+            self._backup_cache = copy.deepcopy(backup)
+            self._backup_dirty = False
+
+    def flush_backup(self) -> None:
+        """Write out changes made by backup_tool or restore_tool with flush=False."""
+        if self._backup_dirty and self._write_backup_file(self._backup_cache):
+            self._backup_dirty = False
+
+    def _write_backup_file(self, backup: Dict[str, Any]) -> bool:
+        """Write a backup configuration to the backup file.
+
+        Args:
+            backup: The backup configuration dictionary to write
+
+        Returns:
+            True if the file was written, False otherwise
+        """
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(self.backup_path)), exist_ok=True)
+            self._ensure_dir(self._backup_dir)
             
-            with open(self.backup_path, 'w') as f:
-                json.dump(backup, f, indent=2)
-                
-            logger.info(f"Backup written to {self.backup_path}")
+            # A new backup holds the same tokens as the config; protect it alike
+            _write_atomic(self.backup_path, _dumps(backup), mode_from=self.config_path)
+            self._backup_stat = _file_stat(self.backup_path)
+
+            logger.debug("Backup written to %s", self.backup_path)
+            return True
         except Exception as e:
             logger.error(f"Error writing backup file: {e}")
             # We don't raise here to avoid disrupting the main functionality
+            return False
     
-    def backup_tool(self, tool_name: str, tool_config: Dict[str, Any]) -> None:
+    def backup_tool(self, tool_name: str, tool_config: Dict[str, Any], flush: bool = True) -> None:
         """Backup a disabled tool.
 
         Args:
             tool_name: Name of the tool to backup
             tool_config: Configuration of the tool to backup
+            flush: Whether to write the backup file now; pass False when
+                   batching changes and call flush_backup() afterwards
         """
-        backup = self.read_backup()
-        backup["mcpServers"][tool_name] = tool_config
-        self.write_backup(backup)
-        logger.info(f"Tool '{tool_name}' backed up")
+        backup = self._get_backup_cached()
+        backup["mcpServers"][tool_name] = copy.deepcopy(tool_config)
+        self._backup_dirty = True
+        if flush:
+            self.flush_backup()
+        logger.debug("Tool '%s' backed up", tool_name)
     
-    def restore_tool(self, tool_name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    def restore_tool(self, tool_name: str, flush: bool = True) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Restore a tool from backup.
 
         Args:
             tool_name: Name of the tool to restore
+            flush: Whether to write the backup file now; pass False when
+                   batching changes and call flush_backup() afterwards
             
         Returns:
             A tuple containing:
             - Boolean indicating success
             - The tool configuration if successful, None otherwise
         """
-        backup = self.read_backup()
+        backup = self._get_backup_cached()
         
         if tool_name not in backup.get("mcpServers", {}):
             logger.warning(f"Tool '{tool_name}' not found in backup")
             return False, None
         
-        tool_config = backup["mcpServers"][tool_name]
-        
         # Remove from backup
-        del backup["mcpServers"][tool_name]
-        self.write_backup(backup)
+        tool_config = backup["mcpServers"].pop(tool_name)
+        self._backup_dirty = True
+        if flush:
+            self.flush_backup()
         
-        logger.info(f"Tool '{tool_name}' restored from backup")
+        logger.debug("Tool '%s' restored from backup", tool_name)
         return True, tool_config
     
     def validate_json_string(self, json_str: str) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
@@ -175,8 +460,15 @@ class ConfigManager:
             - The parsed JSON if valid, None otherwise
             - Error message if invalid, None otherwise
         """
+        # Reject text that can't be a tool definition before parsing it. A key
+        # spelled with \u escapes is left for the parser to decide.
+        if not _OBJECT_START.match(json_str):
+            return False, None, "JSON must be an object containing 'mcpServers'"
+        if '"mcpServers"' not in json_str and '\\u' not in json_str:
+            return False, None, "JSON must contain an 'mcpServers' object"
+
         try:
-            config = json.loads(json_str)
+            config = _loads(json_str)
             
             # Check if the JSON has the expected structure
             if "mcpServers" not in config:
@@ -186,21 +478,9 @@ class ConfigManager:
                 return False, None, "'mcpServers' must be an object"
                 
             # Validate each tool
-            for tool_name, tool_config in config["mcpServers"].items():
-                if not isinstance(tool_config, dict):
-                    return False, None, f"Tool '{tool_name}' configuration must be an object"
-                    
-                if "command" not in tool_config:
-                    return False, None, f"Tool '{tool_name}' must have a 'command' property"
-                    
-                if not isinstance(tool_config["command"], str):
-                    return False, None, f"Tool '{tool_name}' 'command' must be a string"
-                    
-                if "args" in tool_config and not isinstance(tool_config["args"], list):
-                    return False, None, f"Tool '{tool_name}' 'args' must be an array"
-                    
-                if "env" in tool_config and not isinstance(tool_config["env"], dict):
-                    return False, None, f"Tool '{tool_name}' 'env' must be an object"
+            error = _validate_servers(config["mcpServers"])
+            if error is not None:
+                return False, None, error
             
             return True, config, None
         except json.JSONDecodeError as e:
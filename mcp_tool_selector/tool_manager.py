@@ -5,17 +5,47 @@ including enabling, disabling, and adding new tools.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Tuple, Optional
 from .config_manager import ConfigManager
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# How long to wait for further changes before writing a scheduled save
+SAVE_DELAY_MS = 200
+
+
+def _copy_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a tool configuration one level deep.
+
+    Tool configurations are flat apart from the 'args' list and 'env'
+    mapping, so this is enough to stop the tool sharing them with the
+    caller without paying for a full deep copy.
+
+    A hand-edited file may have an entry that isn't an object at all; it
+    is returned unchanged, so it's kept and written back as it was.
+
+    Args:
+        config: The configuration to copy
+
+    Returns:
+        The copied configuration
+    """
+    if not isinstance(config, dict):
+        return config
+    return {
+        key: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    }
+
 
 class Tool:
     """Represents an MCP server tool."""
 
+    # Fixed attribute layout; avoids a per-instance __dict__
+    __slots__ = ("name", "_config", "enabled", "command", "args", "env")
+
     def __init__(self, name: str, config: Dict[str, Any], enabled: bool = True):
         """Initialize a tool.
 
@@ -25,9 +55,40 @@ class Tool:
             enabled: Whether the tool is enabled
         """
         self.name = name
-        self.config = config
+        self.config = _copy_config(config)
         self.enabled = enabled
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The tool's configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: Dict[str, Any]) -> None:
+        """Set the tool's configuration and the fields read from it.
+
+        The command, args and env are looked up here once rather than
+        every time the tool is shown. A hand-edited file may give them any
+        type, so values other than an args list are stored as they are and
+        never rejected here; a failure would drop every tool from the load.
+
+        Args:
+            config: The new configuration, which the tool takes ownership of
+        """
+        self._config = config
+        if not isinstance(config, dict):
+            # Not a server definition; there is nothing to show
+            config = {}
+        self.command = config.get("command", "")
+        args = config.get("args")
+        if isinstance(args, (list, tuple)):
+            args = tuple(args)
+        elif args is None:
+            args = ()
+        self.args = args
+        env = config.get("env")
+        self.env = {} if env is None else env
+
     def __repr__(self) -> str:
         """Return a string representation of the tool."""
         return f"Tool(name={self.name}, enabled={self.enabled})"
@@ -36,27 +97,82 @@ class Tool:
 class ToolManager:
     """Manages MCP server tools."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, tk_root: Optional[Any] = None):
         """Initialize the tool manager.
 
         Args:
             config_manager: The configuration manager to use
+            tk_root: Tk widget whose event loop is used to debounce saves;
+                     without one every change is written immediately
         """
         self.config_manager = config_manager
+        self._tk_root = tk_root
         self.tools: Dict[str, Tool] = {}
+        # Bumped by every change to the tools, so listings can tell whether
+        # they are still current
+        self._version = 0
+
+        # Nesting depth of deferred_save() and whether a save was skipped
+        self._defer_save = 0
+        self._dirty = False
+        # Tk 'after' id of the scheduled save, if any
+        self._pending_save_id: Optional[str] = None
+
+        # (mtime_ns, size) of the configuration file the tools reflect
+        self._loaded_stat: Optional[Tuple[int, int]] = None
+
         self.load_tools()
 
-    def load_tools(self) -> None:
-        """Load tools from the configuration file."""
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Coalesce the saves of several changes into a single write.
+
+        Changes made inside the block are written once when the outermost
+        block exits.
+        """
+        self._defer_save += 1
+        try:
+            yield
+        finally:
+            self._defer_save -= 1
+            if self._defer_save == 0 and self._dirty:
+                self._dirty = False
+                self._save_config()
+
+    def load_tools(self, force: bool = False) -> None:
+        """Load tools from the configuration file.
+
+        Does nothing if the file hasn't changed since it was last loaded
+        or saved, unless forced.
+
+        Args:
+            force: Reload even if the file's modification time and size are
+                   unchanged; an edit may not change either on filesystems
+                   with coarse timestamps
+        """
+        # Don't read the file while a newer state is waiting to be written
+        self.flush()
+
         try:
+            stat = self.config_manager.config_stat()
+            if not force and self.tools and stat is not None and stat == self._loaded_stat:
+                logger.debug("Configuration unchanged, keeping loaded tools")
+                return
+
             config = self.config_manager.read_config()
-            for tool_name, tool_config in config.get("mcpServers", {}).items():
-                self.tools[tool_name] = Tool(tool_name, tool_config)
+            servers = config.get("mcpServers", {})
+            # update() keeps disabled tools, which aren't in the file, and
+            # leaves existing tools in their place in the list
+            self.tools.update({name: Tool(name, tool_config) for name, tool_config in servers.items()})
+            self._version += 1
+            self._loaded_stat = stat
             logger.info(f"Loaded {len(self.tools)} tools from configuration")
         except Exception as e:
             logger.error(f"Error loading tools: {e}")
             # Initialize with empty tools dictionary
             self.tools = {}
+            self._version += 1
+            self._loaded_stat = None
 
     def get_tools(self) -> List[Tool]:
         """Get all tools.
@@ -77,6 +193,14 @@ class ToolManager:
         """
         return self.tools.get(name)
 
+    @property
+    def version(self) -> int:
+        """A number that changes whenever a tool is added, changed or removed.
+
+        Only changes made through the manager are counted.
+        """
+        return self._version
+
     def add_tool(self, name: str, config: Dict[str, Any]) -> bool:
         """Add a new tool.
 
@@ -92,8 +216,9 @@ class ToolManager:
             return False
 
         self.tools[name] = Tool(name, config)
+        self._version += 1
         self._save_config()
-        logger.info(f"Added tool '{name}'")
+        logger.debug("Added tool '%s'", name)
         return True
 
     def update_tool(self, name: str, config: Dict[str, Any]) -> bool:
@@ -110,7 +235,12 @@ class ToolManager:
             logger.warning(f"Tool '{name}' does not exist")
             return False
 
-        self.tools[name].config = config
+        if self.tools[name].config == config:
+            logger.debug("Tool '%s' is unchanged", name)
+            return True
+
+        self.tools[name].config = _copy_config(config)
+        self._version += 1
         self._save_config()
         logger.info(f"Updated tool '{name}'")
         return True
@@ -130,15 +260,16 @@ class ToolManager:
 
         # Check if the tool is already enabled
         if self.tools[name].enabled:
-            logger.info(f"Tool '{name}' is already enabled")
+            logger.debug("Tool '%s' is already enabled", name)
             return True
 
         # Restore from backup if needed
-        success, tool_config = self.config_manager.restore_tool(name)
+        success, tool_config = self.config_manager.restore_tool(name, flush=False)
         if success and tool_config:
             self.tools[name].config = tool_config
 
         self.tools[name].enabled = True
+        self._version += 1
         self._save_config()
         logger.info(f"Enabled tool '{name}'")
         return True
@@ -158,13 +289,14 @@ class ToolManager:
 
         # Check if the tool is already disabled
         if not self.tools[name].enabled:
-            logger.info(f"Tool '{name}' is already disabled")
+            logger.debug("Tool '%s' is already disabled", name)
             return True
 
         # Backup the tool configuration
-        self.config_manager.backup_tool(name, self.tools[name].config)
+        self.config_manager.backup_tool(name, self.tools[name].config, flush=False)
 
         self.tools[name].enabled = False
+        self._version += 1
         self._save_config()
         logger.info(f"Disabled tool '{name}'")
         return True
@@ -184,9 +316,10 @@ class ToolManager:
 
         # Backup the tool configuration if it's enabled
         if self.tools[name].enabled:
-            self.config_manager.backup_tool(name, self.tools[name].config)
+            self.config_manager.backup_tool(name, self.tools[name].config, flush=False)
 
         del self.tools[name]
+        self._version += 1
         self._save_config()
         logger.info(f"Removed tool '{name}'")
         return True
@@ -208,11 +341,26 @@ class ToolManager:
         if not valid or config is None:
             return False, error, []
 
+        return self.add_tools_from_config(config)
+
+    def add_tools_from_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str], List[str]]:
+        """Add tools from an already validated configuration.
+
+        Args:
+            config: A configuration as returned by validate_json_string
+
+        Returns:
+            A tuple containing:
+            - Boolean indicating success
+            - Error message if unsuccessful, None otherwise
+            - List of tool names that were added
+        """
         # Add each tool
         added_tools = []
-        for tool_name, tool_config in config.get("mcpServers", {}).items():
-            if self.add_tool(tool_name, tool_config):
-                added_tools.append(tool_name)
+        with self.deferred_save():
+            for tool_name, tool_config in config.get("mcpServers", {}).items():
+                if self.add_tool(tool_name, tool_config):
+                    added_tools.append(tool_name)
 
         if added_tools:
             logger.info(f"Added {len(added_tools)} tools from JSON")
@@ -220,14 +368,51 @@ class ToolManager:
         else:
             return False, "No tools were added", []
 
+    def flush(self) -> None:
+        """Write a scheduled save now instead of waiting for it."""
+        if self._pending_save_id is not None:
+            self._tk_root.after_cancel(self._pending_save_id)
+            self._flush()
+
+    def _schedule_save(self) -> None:
+        """Schedule a save, pushing back one that is already waiting."""
+        if self._pending_save_id is not None:
+            self._tk_root.after_cancel(self._pending_save_id)
+        self._pending_save_id = self._tk_root.after(SAVE_DELAY_MS, self._flush)
+
+    def _flush(self) -> None:
+        """Write the scheduled save."""
+        self._pending_save_id = None
+        self._write_config()
+
     def _save_config(self) -> None:
-        """Save the current tool configuration."""
+        """Save the current tool configuration.
+
+        Inside deferred_save() this only marks the configuration as changed.
+        With a Tk root the write is scheduled for SAVE_DELAY_MS after the
+        last change, so a quick run of changes is written once.
+        """
+        if self._defer_save > 0:
+            self._dirty = True
+            return
+
+        if self._tk_root is not None:
+            self._schedule_save()
+            return
+
+        self._write_config()
+
+    def _write_config(self) -> None:
+        """Write the current tool configuration to disk."""
         config = {"mcpServers": {}}
         for name, tool in self.tools.items():
             if tool.enabled:  # Only include enabled tools in the main config
                 config["mcpServers"][name] = tool.config
 
         try:
+            # Write the backup first so a disabled tool is always in one of the files
+            self.config_manager.flush_backup()
             self.config_manager.write_config(config)
+            self._loaded_stat = self.config_manager.config_stat()
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
@@ -5,10 +5,11 @@ This module implements the main application window and UI framework.
 
 import os
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+# filedialog and messagebox are imported where they're used to keep startup fast
+from tkinter import ttk
 from typing import Optional, Callable
 
-from ..config_manager import ConfigManager
+from ..config_manager import ConfigManager, EMPTY_CONFIG_JSON
 from ..tool_manager import ToolManager
 from .tool_list import ToolListFrame
 from .tool_editor import ToolEditorFrame
@@ -62,6 +63,9 @@ class MainWindow(tk.Tk):
         self.tool_list = None
         self.tool_editor = None
 
+        # Write any pending changes before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Prompt for config file on startup
         self.after(100, self.prompt_for_config)
 
@@ -74,7 +78,7 @@ class MainWindow(tk.Tk):
         self.file_menu.add_command(label="Open Config", command=self.open_config)
         self.file_menu.add_command(label="New Config", command=self.new_config)
         self.file_menu.add_separator()
-        self.file_menu.add_command(label="Exit", command=self.quit)
+        self.file_menu.add_command(label="Exit", command=self._on_close)
         self.menu_bar.add_cascade(label="File", menu=self.file_menu)
 
         # Tools menu
@@ -91,6 +95,8 @@ class MainWindow(tk.Tk):
 
     def prompt_for_config(self) -> None:
         """Prompt the user to open or create a configuration file."""
+        from tkinter import messagebox
+
         response = messagebox.askyesnocancel(
             "Configuration",
             "Would you like to open an existing configuration file?\n\n"
@@ -108,6 +114,8 @@ class MainWindow(tk.Tk):
 
     def open_config(self) -> None:
         """Open an existing configuration file."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             title="Open Configuration File",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
@@ -118,6 +126,8 @@ class MainWindow(tk.Tk):
 
     def new_config(self) -> None:
         """Create a new configuration file."""
+        from tkinter import filedialog
+
         file_path = filedialog.asksaveasfilename(
             title="Create Configuration File",
             defaultextension=".json",
@@ -126,8 +136,8 @@ class MainWindow(tk.Tk):
 
         if file_path:
             # Create an empty config file
-            with open(file_path, 'w') as f:
-                f.write('{"mcpServers": {}}')
+            with open(file_path, 'wb') as f:
+                f.write(EMPTY_CONFIG_JSON)
 
             self.load_config(file_path)
 
@@ -137,10 +147,15 @@ class MainWindow(tk.Tk):
         Args:
             config_path: Path to the configuration file
         """
+        from tkinter import messagebox
+
         try:
+            if self.tool_manager:
+                self.tool_manager.flush()
+
             self.config_path = config_path
             self.config_manager = ConfigManager(config_path)
-            self.tool_manager = ToolManager(self.config_manager)
+            self.tool_manager = ToolManager(self.config_manager, self)
 
             # Update the window title
             self.title(f"MCP Tool Selector - {os.path.basename(config_path)}")
@@ -169,7 +184,9 @@ class MainWindow(tk.Tk):
     def refresh_tools(self) -> None:
         """Refresh the tool list."""
         if self.tool_manager and self.tool_list:
-            self.tool_manager.load_tools()
+            # The file may have been edited outside the application
+            self.config_manager.invalidate()
+            self.tool_manager.load_tools(force=True)
             self.tool_list.refresh()
             self.status_var.set("Tools refreshed")
 
@@ -183,8 +200,16 @@ class MainWindow(tk.Tk):
         self.notebook.select(0)  # Switch to tool list tab
         self.status_var.set("Tool added")
 
+    def _on_close(self) -> None:
+        """Save pending changes and close the application."""
+        if self.tool_manager:
+            self.tool_manager.flush()
+        self.destroy()
+
     def show_about(self) -> None:
         """Show the about dialog."""
+        from tkinter import messagebox
+
         messagebox.showinfo(
             "About MCP Tool Selector",
             "MCP Tool Selector v0.1.0\n\n"
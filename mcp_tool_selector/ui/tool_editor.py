@@ -4,8 +4,8 @@ This module implements the UI component for adding new tools.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Callable
+from tkinter import ttk
+from typing import Any, Callable, Dict, Optional
 
 from ..tool_manager import ToolManager
 
@@ -25,6 +25,9 @@ class ToolEditorFrame(ttk.Frame):
         self.tool_manager = tool_manager
         self.on_add_callback = on_add_callback
 
+        # Result of the last successful validation, until the text changes
+        self._validated_config: Optional[Dict[str, Any]] = None
+
         # Create the widgets
         self._create_widgets()
 
@@ -73,6 +76,7 @@ class ToolEditorFrame(ttk.Frame):
         # Add the text area for JSON input
         self.json_text = tk.Text(self, height=15, width=80, wrap=tk.NONE)
         self.json_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.json_text.bind("<<Modified>>", self._on_text_modified)
 
         # Add a scrollbar for the text area
         scrollbar_y = ttk.Scrollbar(self.json_text, orient=tk.VERTICAL, command=self.json_text.yview)
@@ -96,28 +100,48 @@ class ToolEditorFrame(ttk.Frame):
         clear_button = ttk.Button(button_frame, text="Clear", command=self._clear_text)
         clear_button.pack(side=tk.LEFT, padx=5)
 
+    def _on_text_modified(self, event: tk.Event) -> None:
+        """Forget the last validation result when the text is edited.
+
+        Args:
+            event: The modified event
+        """
+        if self.json_text.edit_modified():
+            self._validated_config = None
+            # Reset the flag so the next edit fires the event again
+            self.json_text.edit_modified(False)
+
     def _validate_json(self) -> None:
         """Validate the JSON input."""
+        from tkinter import messagebox
+
         json_str = self.json_text.get("1.0", tk.END).strip()
         if not json_str:
             messagebox.showwarning("Validation", "Please enter JSON content.")
             return
 
-        valid, _, error = self.tool_manager.config_manager.validate_json_string(json_str)
+        valid, config, error = self.tool_manager.config_manager.validate_json_string(json_str)
         if valid:
+            self._validated_config = config
             messagebox.showinfo("Validation", "JSON is valid.")
         else:
             messagebox.showerror("Validation Error", error or "Invalid JSON format.")
 
     def _add_tools(self) -> None:
         """Add tools from the JSON input."""
-        json_str = self.json_text.get("1.0", tk.END).strip()
-        if not json_str:
-            messagebox.showwarning("Add Tools", "Please enter JSON content.")
-            return
+        from tkinter import messagebox
+
+        if self._validated_config is not None:
+            # The text hasn't changed since it was validated
+            success, error, added_tools = self.tool_manager.add_tools_from_config(self._validated_config)
+        else:
+            json_str = self.json_text.get("1.0", tk.END).strip()
+            if not json_str:
+                messagebox.showwarning("Add Tools", "Please enter JSON content.")
+                return
 
-        # Validate and add the tools
-        success, error, added_tools = self.tool_manager.add_tools_from_json(json_str)
+            # Validate and add the tools
+            success, error, added_tools = self.tool_manager.add_tools_from_json(json_str)
 
         if success and added_tools:
             messagebox.showinfo(
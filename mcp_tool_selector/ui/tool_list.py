@@ -3,12 +3,103 @@
 This module implements the UI component for displaying and managing tools.
 """
 
+import bisect
+import functools
+import itertools
+import math
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Callable, Dict, Any, Optional
+from dataclasses import dataclass
+from tkinter import font as tkfont
+from tkinter import ttk
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from ..tool_manager import ToolManager, Tool
 
+# Space around each row, matching the old pack(padx=10, pady=5)
+ROW_PADX = 10
+ROW_PADY = 5
+
+# Rows kept alive above and below the visible ones, so short scrolls
+# don't have to build widgets
+ROW_BUFFER = 2
+
+# Mouse wheel events: Windows and macOS, then X11 scroll up and down
+MOUSEWHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+@functools.lru_cache(maxsize=512)
+def _format_details(config_key: Tuple[Any, Tuple[Any, ...], Tuple[Tuple[Any, Any], ...]]) -> Tuple[str, str, Tuple[str, ...]]:
+    """Render the detail lines shown for a tool.
+
+    Args:
+        config_key: The tool's command, args and env items
+
+    Returns:
+        The command text, the args text (empty without args) and one line
+        per environment variable
+    """
+    command, args, env = config_key
+    command_text = f"Command: {command}"
+    args_text = f"Args: {' '.join(map(str, args))}" if args else ""
+    env_lines = tuple(f"  {key}: {value}" for key, value in env)
+    return command_text, args_text, env_lines
+
+
+def _tool_details(tool: Tool) -> Tuple[str, str, Tuple[str, ...]]:
+    """Get the rendered detail lines for a tool.
+
+    Args:
+        tool: The tool
+
+    Returns:
+        The same tuple as _format_details
+    """
+    # A hand-edited file may hold other types: show a lone args value as a
+    # single argument, and leave out env that isn't a mapping
+    args = tool.args if isinstance(tool.args, tuple) else (tool.args,)
+    env = tuple(tool.env.items()) if isinstance(tool.env, dict) else ()
+    config_key = (tool.command, args, env)
+    try:
+        return _format_details(config_key)
+    except TypeError:
+        # Nested values in a hand-edited file can't be hashed; render directly
+        return _format_details.__wrapped__(config_key)
+
+
+def _grid(widget: tk.Misc, **options: Any) -> None:
+    """Grid a widget with a single Tcl call.
+
+    Unlike widget.grid(), the options are passed to Tcl as they are,
+    skipping tkinter's option conversion for each of the row widgets.
+
+    Args:
+        widget: The widget to grid
+        options: The grid options, e.g. row=0, sticky=tk.W
+    """
+    widget.tk.call(
+        "grid", "configure", str(widget),
+        *itertools.chain.from_iterable((f"-{key}", value) for key, value in options.items())
+    )
+
+
+@dataclass
+class RowWidgets:
+    """The widgets of a row, which are reused for other tools once hidden."""
+
+    frame: ttk.Frame
+    # Canvas window item showing the frame
+    window: int
+    name_label: ttk.Label
+    status_label: ttk.Label
+    toggle_button: ttk.Button
+    details_label: ttk.Label
+    env_frame: ttk.Frame
+    # Read-only text holding one line per environment variable
+    env_text: tk.Text
+    # The tool shown and the configuration its details were rendered from
+    tool: Optional[Tool] = None
+    config: Optional[Dict[str, Any]] = None
+
 
 class ToolListFrame(ttk.Frame):
     """Frame for displaying and managing tools."""
@@ -24,7 +115,25 @@ class ToolListFrame(ttk.Frame):
         super().__init__(parent)
         self.tool_manager = tool_manager
         self.on_change_callback = on_change_callback
-        self.tool_frames: Dict[str, ttk.Frame] = {}
+
+        # Only rows near the viewport exist as widgets. _offsets[i] is the y
+        # position of row i and _offsets[-1] the height of the whole list.
+        self._tools: List[Tool] = []
+        self._heights: List[int] = []
+        self._offsets: List[int] = [0]
+        self._positions: Dict[str, int] = {}
+        self._live_rows: Dict[int, RowWidgets] = {}
+        # Hidden rows waiting to be reused, so scrolling and refreshing don't
+        # keep destroying and creating widgets
+        self._row_pool: List[RowWidgets] = []
+        self._no_tools_frame: Optional[ttk.Frame] = None
+        # Tool manager version the last full refresh showed, to skip
+        # refreshes that would show the same; None when the list has changed
+        self._last_version: Optional[int] = None
+        # Tk 'after' id of the scheduled relayout, if any
+        self._relayout_id: Optional[str] = None
+        # Tcl commands of the global mouse wheel bindings while installed
+        self._mousewheel_commands: List[str] = []
 
         # Create the main layout
         self._create_widgets()
@@ -32,6 +141,14 @@ class ToolListFrame(ttk.Frame):
 
     def _create_widgets(self) -> None:
         """Create the widgets for the tool list frame."""
+        # Configure the row styles once rather than for every row
+        self._style = ttk.Style(self)
+        self._style.configure("Tool.TFrame", relief=tk.GROOVE, borderwidth=1)
+
+        # Create a style for enabled/disabled tools
+        self._style.configure("Enabled.TLabel", foreground="green")
+        self._style.configure("Disabled.TLabel", foreground="red")
+
         # Create a frame for the header
         header_frame = ttk.Frame(self)
         header_frame.pack(fill=tk.X, pady=(0, 5))
@@ -48,24 +165,75 @@ class ToolListFrame(ttk.Frame):
         separator = ttk.Separator(self, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, pady=5)
 
-        # Create a canvas with scrollbar for the tool list
+        # Create a canvas with scrollbar for the tool list. Rows are placed on
+        # the canvas directly, so the scroll region is known without asking
+        # Tk for the bounding box of every row.
         self.canvas = tk.Canvas(self, borderwidth=0, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor=tk.NW)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Bind mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Height of a line of label text, used to estimate row heights
+        # before a row has been built and measured
+        self._font = tkfont.nametofont("TkDefaultFont")
+        self._line_height = self._font.metrics("linespace")
+        # A text widget's width is counted in widths of "0"
+        self._zero_width = self._font.measure("0")
+
+        # Bind mouse wheel scrolling while the pointer is over the list
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+
+    def _bind_mousewheel(self, event: tk.Event) -> None:
+        """Start routing mouse wheel events to the list.
+
+        The wheel goes to the widget under the pointer, which is usually a
+        row rather than the canvas, so the binding has to be global while
+        the pointer is inside.
+
+        Args:
+            event: The enter event
+        """
+        if self._mousewheel_commands:
+            return
+
+        # bind_all() doesn't free the Tcl command it creates for the callback
+        # when the binding is replaced or removed, so keep the names and
+        # delete them when unbinding
+        self._mousewheel_commands = [
+            self.canvas.bind_all(sequence, self._on_mousewheel) for sequence in MOUSEWHEEL_SEQUENCES
+        ]
+
+    def _unbind_mousewheel(self, event: tk.Event) -> None:
+        """Stop routing mouse wheel events to the list.
+
+        Args:
+            event: The leave event
+        """
+        # Moving onto a row also leaves the canvas; keep scrolling then
+        try:
+            widget = self.canvas.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            widget = None
+        canvas_path = str(self.canvas)
+        if widget is not None and (str(widget) == canvas_path or str(widget).startswith(canvas_path + ".")):
+            return
+
+        self._remove_mousewheel_bindings()
+
+    def _remove_mousewheel_bindings(self) -> None:
+        """Remove the global mouse wheel bindings and free their commands."""
+        for sequence in MOUSEWHEEL_SEQUENCES:
+            self.canvas.unbind_all(sequence)
+        # Depending on the Python version bind_all() files the command under the
+        # root widget, so delete it there to keep the root's list in step
+        root = self.canvas._root()
+        for command in self._mousewheel_commands:
+            root.deletecommand(command)
+        self._mousewheel_commands = []
 
     def _on_mousewheel(self, event: tk.Event) -> None:
         """Handle mouse wheel scrolling.
@@ -73,112 +241,396 @@ class ToolListFrame(ttk.Frame):
         Args:
             event: The mouse wheel event
         """
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        elif event.delta:
+            # Windows reports multiples of 120, macOS much smaller values
+            units = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        else:
+            return
+
+        self.canvas.yview_scroll(units, "units")
+        self._schedule_relayout()
+
+    def _yview(self, *args: Any) -> None:
+        """Scroll the canvas from the scrollbar and build newly visible rows.
+
+        Args:
+            args: The scrollbar's yview arguments
+        """
+        self.canvas.yview(*args)
+        self._schedule_relayout()
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:
+        """Stretch the rows to the new canvas width and fill the new viewport.
+
+        Args:
+            event: The configure event
+        """
+        width = self._row_width()
+        for row in self._live_rows.values():
+            self.canvas.itemconfigure(row.window, width=width)
+        self._update_scrollregion()
+        self._schedule_relayout()
+
+    def _row_width(self) -> int:
+        """Get the width of a row for the current canvas size."""
+        return max(self.canvas.winfo_width() - 2 * ROW_PADX, 1)
+
+    def _estimate_height(self, tool: Tool) -> int:
+        """Estimate the height of a tool's row before it is built.
+
+        Args:
+            tool: The tool to estimate the row height for
+
+        Returns:
+            The estimated height of the row, including the space around it
+        """
+        # Name and buttons take about two lines, then one per detail line
+        lines = 3
+        if tool.args:
+            lines += 1
+        if tool.env and isinstance(tool.env, dict):
+            lines += 1 + len(tool.env)
+        return lines * self._line_height + 6 * ROW_PADY
+
+    def _update_offsets(self, start: int = 0) -> None:
+        """Recompute row positions from their heights and move the live rows.
+
+        Args:
+            start: The first row whose height changed; rows above it keep
+                   their positions
+        """
+        offsets = self._offsets
+        offsets[start:] = itertools.accumulate(self._heights[start:], initial=offsets[start])
+
+        for index, row in self._live_rows.items():
+            if index >= start:
+                self.canvas.coords(row.window, ROW_PADX, offsets[index] + ROW_PADY)
+        self._update_scrollregion()
+
+    def _update_scrollregion(self) -> None:
+        """Size the scroll region to the whole list, built or not."""
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), self._offsets[-1]))
+
+    def _schedule_relayout(self) -> None:
+        """Relayout once the pending events have been handled.
+
+        A scrollbar drag or a resize delivers a burst of events; they are
+        folded into a single relayout instead of one each.
+        """
+        if self._relayout_id is None:
+            self._relayout_id = self.after_idle(self._run_scheduled_relayout)
+
+    def _run_scheduled_relayout(self) -> None:
+        """Run the relayout scheduled by _schedule_relayout."""
+        self._relayout_id = None
+        self._relayout()
+
+    def destroy(self) -> None:
+        """Cancel pending callbacks and global bindings, then destroy the frame."""
+        if self._relayout_id is not None:
+            self.after_cancel(self._relayout_id)
+            self._relayout_id = None
+        if self._mousewheel_commands:
+            self._remove_mousewheel_bindings()
+        super().destroy()
+
+    def _relayout(self) -> None:
+        """Show the rows in or near the viewport and hide the others."""
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(bisect.bisect_right(self._offsets, top) - 1 - ROW_BUFFER, 0)
+        last = min(bisect.bisect_left(self._offsets, bottom) + ROW_BUFFER, len(self._tools))
+
+        for index in [i for i in self._live_rows if not first <= i < last]:
+            self._release_row(index)
+
+        created = [i for i in range(first, last) if i not in self._live_rows]
+        for index in created:
+            self._add_tool_to_list(self._tools[index], index)
+        if created:
+            self._measure_rows(created)
+
+    def _measure_rows(self, indices: List[int]) -> None:
+        """Replace the estimated heights of newly built rows with real ones.
+
+        Args:
+            indices: The indices of the rows to measure
+        """
+        # Let Tk compute the requested sizes of the new rows
+        self.canvas.update_idletasks()
+
+        first_changed: Optional[int] = None
+        for index in indices:
+            # Idle callbacks run above may already have dropped the row
+            row = self._live_rows.get(index)
+            if row is None:
+                continue
+            height = row.frame.winfo_reqheight() + 2 * ROW_PADY
+            if height != self._heights[index]:
+                self._heights[index] = height
+                if first_changed is None or index < first_changed:
+                    first_changed = index
+
+        if first_changed is not None:
+            self._update_offsets(first_changed)
+            # Rows may have moved into or out of the viewport
+            self._schedule_relayout()
+
+    def _release_row(self, index: int) -> None:
+        """Hide a row and keep its widgets for reuse.
+
+        Args:
+            index: The index of the row to release
+        """
+        row = self._live_rows.pop(index)
+        self.canvas.itemconfigure(row.window, state=tk.HIDDEN)
+        row.tool = None
+        row.config = None
+        self._row_pool.append(row)
+
+    def _update_row(self, name: str) -> None:
+        """Show a tool's new state in its row without rebuilding the list.
+
+        Args:
+            name: The name of the tool that changed
+        """
+        index = self._positions[name]
+        row = self._live_rows.get(index)
+        if row is None:
+            # Not built; it will be built from the current state when shown
+            return
+
+        self._last_version = None
+        tool = self._tools[index]
+        if tool.config is not row.config and tool.config != row.config:
+            # The details changed too, e.g. a different config was restored
+            self._bind_row(row, tool)
+            self._measure_rows([index])
+            return
+
+        self._show_state(row, tool)
+
+    def _remove_row(self, name: str) -> None:
+        """Remove a tool's row and close the gap without rebuilding the list.
+
+        Args:
+            name: The name of the tool that was removed
+        """
+        index = self._positions[name]
+        if index in self._live_rows:
+            self._release_row(index)
+
+        self._last_version = None
+        del self._tools[index]
+        del self._heights[index]
+        if not self._tools:
+            # Show the placeholder
+            self.refresh()
+            return
+
+        # Rows after the removed one move up a place
+        self._live_rows = {i - (i > index): row for i, row in self._live_rows.items()}
+        self._positions = {tool.name: i for i, tool in enumerate(self._tools)}
+
+        self._update_offsets(index)
+        self._relayout()
 
     def refresh(self) -> None:
-        """Refresh the tool list."""
+        """Refresh the tool list.
+
+        Does nothing if no tool has changed since the list was last built.
+        """
+        version = self.tool_manager.version
+        if version == self._last_version:
+            return
+
         # Clear existing tool frames
-        for frame in self.tool_frames.values():
-            frame.destroy()
-        self.tool_frames = {}
+        for index in list(self._live_rows):
+            self._release_row(index)
+
+        if self._no_tools_frame is not None:
+            self.canvas.delete("no_tools")
+            self._no_tools_frame.destroy()
+            self._no_tools_frame = None
 
         # Get the list of tools
-        tools = self.tool_manager.get_tools()
+        self._tools = self.tool_manager.get_tools()
+        self._positions = {tool.name: i for i, tool in enumerate(self._tools)}
+        self._heights = [self._estimate_height(tool) for tool in self._tools]
+        self._update_offsets()
 
-        if not tools:
+        if not self._tools:
             # Display a message if no tools are available
-            no_tools_frame = ttk.Frame(self.scrollable_frame)
-            no_tools_frame.pack(fill=tk.X, padx=10, pady=5)
+            self._no_tools_frame = ttk.Frame(self.canvas)
+            self.canvas.create_window(
+                (ROW_PADX, ROW_PADY), window=self._no_tools_frame, anchor=tk.NW, tags="no_tools"
+            )
 
             no_tools_label = ttk.Label(
-                no_tools_frame,
+                self._no_tools_frame,
                 text="No tools available. Add tools using the 'Add Tool' tab.",
                 foreground="gray"
             )
             no_tools_label.pack(pady=20)
+        else:
+            # Build the rows that are visible
+            self._relayout()
 
-            return
+        self._last_version = version
 
-        # Add each tool to the list
-        for tool in tools:
-            self._add_tool_to_list(tool)
-
-    def _add_tool_to_list(self, tool: Tool) -> None:
-        """Add a tool to the list.
+    def _add_tool_to_list(self, tool: Tool, index: int) -> None:
+        """Add a tool's row to the list.
 
         Args:
             tool: The tool to add
+            index: The position of the tool in the list
         """
-        # Create a frame for the tool
-        tool_frame = ttk.Frame(self.scrollable_frame)
-        tool_frame.pack(fill=tk.X, padx=10, pady=5)
+        row = self._row_pool.pop() if self._row_pool else self._build_row()
+        self._bind_row(row, tool)
 
-        # Add a border around the frame
-        tool_frame.configure(style="Tool.TFrame")
-        style = ttk.Style()
-        style.configure("Tool.TFrame", relief=tk.GROOVE, borderwidth=1)
+        self.canvas.coords(row.window, ROW_PADX, self._offsets[index] + ROW_PADY)
+        self.canvas.itemconfigure(row.window, state=tk.NORMAL, width=self._row_width())
 
-        # Create a style for enabled/disabled tools
-        style.configure("Enabled.TLabel", foreground="green")
-        style.configure("Disabled.TLabel", foreground="red")
+        # Store the widgets for later reference
+        self._live_rows[index] = row
+
+    def _build_row(self) -> RowWidgets:
+        """Build the widgets of a row, to be filled in by _bind_row.
+
+        Returns:
+            The new row, hidden until it is placed
+        """
+        # Create a frame for the tool, with a border around it
+        tool_frame = ttk.Frame(self.canvas, style="Tool.TFrame")
+        window = self.canvas.create_window(0, 0, window=tool_frame, anchor=tk.NW, state=tk.HIDDEN)
 
         # Add the tool name
-        name_label = ttk.Label(tool_frame, text=tool.name, font=("TkDefaultFont", 10, "bold"))
-        name_label.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        name_label = ttk.Label(tool_frame, font=("TkDefaultFont", 10, "bold"))
+        _grid(name_label, row=0, column=0, sticky=tk.W, padx=5, pady=5)
 
         # Add the tool status
-        status_text = "Enabled" if tool.enabled else "Disabled"
-        status_style = "Enabled.TLabel" if tool.enabled else "Disabled.TLabel"
-        status_label = ttk.Label(tool_frame, text=status_text, style=status_style)
-        status_label.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        status_label = ttk.Label(tool_frame)
+        _grid(status_label, row=0, column=1, sticky=tk.W, padx=5, pady=5)
 
         # Add the toggle button
-        toggle_text = "Disable" if tool.enabled else "Enable"
-        toggle_button = ttk.Button(
-            tool_frame,
-            text=toggle_text,
-            command=lambda t=tool: self._toggle_tool(t)
-        )
-        toggle_button.grid(row=0, column=2, sticky=tk.E, padx=5, pady=5)
+        toggle_button = ttk.Button(tool_frame)
+        _grid(toggle_button, row=0, column=2, sticky=tk.E, padx=5, pady=5)
 
         # Add the remove button
-        remove_button = ttk.Button(
-            tool_frame,
-            text="Remove",
-            command=lambda t=tool: self._remove_tool(t)
+        remove_button = ttk.Button(tool_frame, text="Remove")
+        _grid(remove_button, row=0, column=3, sticky=tk.E, padx=5, pady=5)
+
+        # Add the command and the arguments, as one label
+        details_label = ttk.Label(tool_frame, justify=tk.LEFT)
+        _grid(details_label, row=1, column=0, columnspan=4, sticky=tk.W, padx=5, pady=5)
+
+        # Add the environment variables, shown only for tools that have some
+        env_frame = ttk.Frame(tool_frame)
+        _grid(env_frame, row=2, column=0, columnspan=4, sticky=tk.W, padx=5, pady=5)
+        env_frame.grid_remove()
+
+        env_label = ttk.Label(env_frame, text="Environment Variables:")
+        env_label.pack(anchor=tk.W)
+
+        # A single text widget for all the variables rather than a label each
+        env_text = tk.Text(
+            env_frame,
+            font="TkDefaultFont",
+            wrap=tk.NONE,
+            borderwidth=0,
+            highlightthickness=0,
+            padx=0,
+            pady=0,
+            takefocus=0,
+            background=self._style.lookup("TFrame", "background"),
+            state=tk.DISABLED
         )
-        remove_button.grid(row=0, column=3, sticky=tk.E, padx=5, pady=5)
+        env_text.pack(anchor=tk.W)
 
-        # Add the tool details
-        details_frame = ttk.Frame(tool_frame)
-        details_frame.grid(row=1, column=0, columnspan=4, sticky=tk.W, padx=5, pady=5)
+        row = RowWidgets(tool_frame, window, name_label, status_label, toggle_button, details_label, env_frame, env_text)
 
-        # Add the command
-        command_label = ttk.Label(details_frame, text=f"Command: {tool.config.get('command', '')}")
-        command_label.pack(anchor=tk.W)
+        # The buttons act on whichever tool the row shows, so their commands
+        # are registered once rather than each time the row is reused
+        toggle_button.configure(command=functools.partial(self._toggle_row, row))
+        remove_button.configure(command=functools.partial(self._remove_row_tool, row))
+        return row
 
-        # Add the arguments if available
-        args = tool.config.get('args', [])
-        if args:
-            args_str = " ".join(str(arg) for arg in args)
-            args_label = ttk.Label(details_frame, text=f"Args: {args_str}")
-            args_label.pack(anchor=tk.W)
+    def _bind_row(self, row: RowWidgets, tool: Tool) -> None:
+        """Show a tool in a row.
 
-        # Add the environment variables if available
-        env = tool.config.get('env', {})
-        if env:
-            env_frame = ttk.Frame(details_frame)
-            env_frame.pack(anchor=tk.W, fill=tk.X, pady=(5, 0))
+        Args:
+            row: The row to fill in
+            tool: The tool to show
+        """
+        row.tool = tool
+        row.config = tool.config
+        row.name_label.configure(text=tool.name)
+        self._show_state(row, tool)
+
+        command_text, args_text, env_lines = _tool_details(tool)
+        details_text = f"{command_text}\n{args_text}" if args_text else command_text
+        row.details_label.configure(text=details_text)
+
+        if not env_lines:
+            _grid(row.details_label, pady=5)
+            row.env_frame.grid_remove()
+            return
 
-            env_label = ttk.Label(env_frame, text="Environment Variables:")
-            env_label.pack(anchor=tk.W)
+        _grid(row.details_label, pady=(5, 0))
+        # Restore the env frame with the options it was first gridded with
+        _grid(row.env_frame)
+
+        env_text = row.env_text
+        text = "\n".join(env_lines)
+        env_text.configure(state=tk.NORMAL)
+        env_text.delete("1.0", tk.END)
+        env_text.insert("1.0", text)
+
+        # Size the text to show every line in full, as the labels it replaced
+        # did. Values may hold newlines, and wide glyphs take more room than
+        # the "0" the width is counted in, so measure the lines in the font.
+        lines = text.split("\n")
+        width = max(self._font.measure(line) for line in lines)
+        env_text.configure(
+            state=tk.DISABLED,
+            height=len(lines),
+            width=max(math.ceil(width / self._zero_width), 1)
+        )
 
-            for key, value in env.items():
-                env_var_label = ttk.Label(env_frame, text=f"  {key}: {value}")
-                env_var_label.pack(anchor=tk.W)
+    def _show_state(self, row: RowWidgets, tool: Tool) -> None:
+        """Show a tool's enabled status in its row.
 
-        # Store the frame for later reference
-        self.tool_frames[tool.name] = tool_frame
+        Args:
+            row: The row showing the tool
+            tool: The tool
+        """
+        row.status_label.configure(
+            text="Enabled" if tool.enabled else "Disabled",
+            style="Enabled.TLabel" if tool.enabled else "Disabled.TLabel"
+        )
+        row.toggle_button.configure(text="Disable" if tool.enabled else "Enable")
+
+    def _toggle_row(self, row: RowWidgets) -> None:
+        """Toggle the tool shown in a row.
+
+        Args:
+            row: The row whose toggle button was pressed
+        """
+        if row.tool is not None:
+            self._toggle_tool(row.tool)
+
+    def _remove_row_tool(self, row: RowWidgets) -> None:
+        """Remove the tool shown in a row.
+
+        Args:
+            row: The row whose remove button was pressed
+        """
+        if row.tool is not None:
+            self._remove_tool(row.tool)
 
     def _toggle_tool(self, tool: Tool) -> None:
         """Toggle a tool's enabled status.
@@ -186,14 +638,16 @@ class ToolListFrame(ttk.Frame):
         Args:
             tool: The tool to toggle
         """
+        from tkinter import messagebox
+
         try:
             if tool.enabled:
                 self.tool_manager.disable_tool(tool.name)
             else:
                 self.tool_manager.enable_tool(tool.name)
 
-            # Refresh the list
-            self.refresh()
+            # Update just this tool's row
+            self._update_row(tool.name)
 
             # Call the change callback
             if self.on_change_callback:
@@ -207,6 +661,8 @@ class ToolListFrame(ttk.Frame):
         Args:
             tool: The tool to remove
         """
+        from tkinter import messagebox
+
         # Confirm removal
         confirm = messagebox.askyesno(
             "Confirm Removal",
@@ -219,8 +675,8 @@ class ToolListFrame(ttk.Frame):
         try:
             self.tool_manager.remove_tool(tool.name)
 
-            # Refresh the list
-            self.refresh()
+            # Drop just this tool's row
+            self._remove_row(tool.name)
 
             # Call the change callback
             if self.on_change_callback:
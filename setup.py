@@ -38,6 +38,10 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     python_requires=">=3.8",
+    extras_require={
+        # Faster JSON parsing and serialization for large configurations
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "mcp-tool-selector=mcp_tool_selector.app:main",
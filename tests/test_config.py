@@ -1,45 +1,51 @@
 """Tests for the configuration manager."""
 
+import copy
 import json
 import os
-import tempfile
+import stat
 import pytest
 from pathlib import Path
 
 from mcp_tool_selector.config_manager import ConfigManager
 
 
+@pytest.fixture(scope="session")
+def base_config():
+    """The configuration the config manager tests start from.
+
+    Shared by all tests, so never modified; tests work on a copy.
+    """
+    return {
+        "mcpServers": {
+            "test-tool": {
+                "command": "npx",
+                "args": ["-y", "@test/tool"]
+            }
+        }
+    }
+
+
 class TestConfigManager:
     """Test cases for the ConfigManager class."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, base_config):
         """Set up test fixtures."""
-        # Create temporary files for testing
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.config_path = os.path.join(self.temp_dir.name, "config.json")
-        self.backup_path = os.path.join(self.temp_dir.name, "config.json.backup")
+        # Each test gets its own directory, so tests can run in parallel
+        self.temp_dir = tmp_path
+        self.config_path = os.path.join(tmp_path, "config.json")
+        self.backup_path = os.path.join(tmp_path, "config.json.backup")
         
-        # Create a test configuration
-        self.test_config = {
-            "mcpServers": {
-                "test-tool": {
-                    "command": "npx",
-                    "args": ["-y", "@test/tool"]
-                }
-            }
-        }
+        # Start from a copy of the shared test configuration
+        self.test_config = copy.deepcopy(base_config)
         
         # Write the test configuration to the file
-        with open(self.config_path, "w") as f:
-            json.dump(self.test_config, f)
+        Path(self.config_path).write_text(json.dumps(self.test_config))
         
         # Create the config manager
         self.config_manager = ConfigManager(self.config_path)
     
-    def teardown_method(self):
-        """Tear down test fixtures."""
-        self.temp_dir.cleanup()
-    
     def test_read_config(self):
         """Test reading a configuration file."""
         config = self.config_manager.read_config()
@@ -50,7 +56,7 @@ class TestConfigManager:
     def test_read_nonexistent_config(self):
         """Test reading a non-existent configuration file."""
         # Create a config manager with a non-existent file
-        nonexistent_path = os.path.join(self.temp_dir.name, "nonexistent.json")
+        nonexistent_path = os.path.join(self.temp_dir, "nonexistent.json")
         config_manager = ConfigManager(nonexistent_path)
         
         # Reading should return an empty config
@@ -77,6 +83,39 @@ class TestConfigManager:
             config = json.load(f)
         
         assert config == modified_config
+        
+        # The temporary file should have been renamed over the config
+        assert not os.path.exists(self.config_path + ".tmp")
+    
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need extra privileges on Windows")
+    def test_write_config_follows_symlink(self):
+        """Test that writing through a symlinked config updates its target."""
+        real_dir = os.path.join(self.temp_dir, "dotfiles")
+        os.mkdir(real_dir)
+        real_path = os.path.join(real_dir, "real.json")
+        os.replace(self.config_path, real_path)
+        os.symlink(real_path, self.config_path)
+        
+        modified_config = {"mcpServers": {"other-tool": {"command": "uvx"}}}
+        self.config_manager.write_config(modified_config)
+        
+        assert os.path.islink(self.config_path)
+        with open(real_path, "r") as f:
+            assert json.load(f) == modified_config
+        assert not os.path.exists(real_path + ".tmp")
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_write_config_keeps_mode(self):
+        """Test that writing a config keeps its file permissions."""
+        os.chmod(self.config_path, 0o600)
+        
+        self.config_manager.write_config({"mcpServers": {}})
+        
+        assert stat.S_IMODE(os.stat(self.config_path).st_mode) == 0o600
+        
+        # A backup created next to it gets the same permissions
+        self.config_manager.backup_tool("test-tool", self.test_config["mcpServers"]["test-tool"])
+        assert stat.S_IMODE(os.stat(self.backup_path).st_mode) == 0o600
     
     def test_backup_tool(self):
         """Test backing up a tool."""
@@ -141,3 +180,113 @@ class TestConfigManager:
         assert not valid
         assert config is None
         assert error is not None
+        
+        # Not an object, or no mcpServers key
+        for json_str in ["not json at all", "[1, 2, 3]", '{"servers": {}}']:
+            valid, config, error = self.config_manager.validate_json_string(json_str)
+            
+            assert not valid
+            assert config is None
+            assert error is not None
+    
+    def test_validate_json_string_escaped_key(self):
+        """Test that a key written with unicode escapes is still accepted."""
+        json_str = '{"\\u006dcpServers": {"test-tool": {"command": "npx"}}}'
+        valid, config, error = self.config_manager.validate_json_string(json_str)
+        
+        assert valid
+        assert "test-tool" in config["mcpServers"]
+    
+    def test_read_config_returns_copy(self):
+        """Test that cached reads can't be modified by the caller."""
+        config = self.config_manager.read_config()
+        config["mcpServers"]["test-tool"]["command"] = "changed"
+        
+        config = self.config_manager.read_config()
+        assert config == self.test_config
+    
+    def test_read_config_detects_external_change(self):
+        """Test that a file changed on disk is read again."""
+        self.config_manager.read_config()
+        
+        # Change the file behind the config manager's back
+        external_config = {"mcpServers": {"other-tool": {"command": "uvx", "args": ["other"]}}}
+        with open(self.config_path, "w") as f:
+            json.dump(external_config, f)
+        
+        config = self.config_manager.read_config()
+        assert config == external_config
+    
+    def test_write_config_creates_directory(self):
+        """Test writing a configuration file into a directory that doesn't exist yet."""
+        config_path = os.path.join(self.temp_dir, "nested", "config.json")
+        config_manager = ConfigManager(config_path)
+        
+        config_manager.write_config(self.test_config)
+        
+        assert config_manager.read_config() == self.test_config
+    
+    def test_read_large_config(self):
+        """Test reading a configuration large enough to be memory-mapped."""
+        large_config = {
+            "mcpServers": {
+                f"tool-{i}": {"command": "npx", "args": ["-y", f"@test/tool-{i}"] * 10}
+                for i in range(2000)
+            }
+        }
+        with open(self.config_path, "w") as f:
+            json.dump(large_config, f)
+        assert os.path.getsize(self.config_path) > 256 * 1024
+        
+        config = self.config_manager.read_config()
+        assert config == large_config
+    
+    def test_write_config_non_ascii(self):
+        """Test that non-ASCII text is written as UTF-8 and read back intact."""
+        config = {"mcpServers": {"test-tool": {"command": "npx", "args": ["/Users/josé/tools"]}}}
+        
+        self.config_manager.write_config(config)
+        
+        with open(self.config_path, "rb") as f:
+            assert "josé".encode("utf-8") in f.read()
+        
+        self.config_manager.invalidate()
+        assert self.config_manager.read_config() == config
+    
+    def test_read_config_cached(self, monkeypatch):
+        """Test that an unchanged file is read from disk only once."""
+        from mcp_tool_selector import config_manager
+        
+        reads = []
+        read_json_file = config_manager._read_json_file
+        monkeypatch.setattr(config_manager, "_read_json_file", lambda *args: (reads.append(args), read_json_file(*args))[1])
+        
+        first = self.config_manager.read_config()
+        second = self.config_manager.read_config()
+        assert first == second == self.test_config
+        assert len(reads) == 1
+        
+        # Each read parses its own tree from the cached bytes
+        assert first is not second
+        assert first["mcpServers"] is not second["mcpServers"]
+        
+        # A write refreshes the cache without reading the file back
+        written = {"mcpServers": {"other-tool": {"command": "uvx"}}}
+        self.config_manager.write_config(written)
+        written["mcpServers"]["other-tool"]["command"] = "changed"
+        assert self.config_manager.read_config() == {"mcpServers": {"other-tool": {"command": "uvx"}}}
+        assert len(reads) == 1
+    
+    def test_json_backends_match(self, monkeypatch):
+        """Test that the standard library fallback writes the same bytes as orjson."""
+        from mcp_tool_selector import config_manager
+        
+        if config_manager.orjson is None:
+            pytest.skip("orjson is not installed")
+        
+        config = {"mcpServers": {"test-tool": {"command": "npx", "args": ["-y", "@test/tool", "josé"], "env": {}}}}
+        fast = config_manager._dumps(config)
+        
+        monkeypatch.setattr(config_manager, "orjson", None)
+        assert config_manager._dumps(config) == fast
+        assert config_manager._loads(fast) == config
@@ -1,8 +1,8 @@
 """Tests for the tool manager."""
 
+import copy
 import json
 import os
-import tempfile
 import pytest
 from pathlib import Path
 
@@ -10,45 +10,72 @@ from mcp_tool_selector.config_manager import ConfigManager
 from mcp_tool_selector.tool_manager import ToolManager, Tool
 
 
+class FakeTkRoot:
+    """Stand-in for a Tk widget that records scheduled callbacks."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.scheduled = 0
+
+    def after(self, ms, func):
+        after_id = f"after#{self.scheduled}"
+        self.scheduled += 1
+        self.callbacks[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.callbacks[after_id]
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, {}
+        for func in callbacks.values():
+            func()
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """The configuration the tool manager tests start from.
+
+    Shared by all tests, so never modified; tests work on a copy.
+    """
+    return {
+        "mcpServers": {
+            "test-tool-1": {
+                "command": "npx",
+                "args": ["-y", "@test/tool-1"]
+            },
+            "test-tool-2": {
+                "command": "npx",
+                "args": ["-y", "@test/tool-2"],
+                "env": {
+                    "TEST_VAR": "test-value"
+                }
+            }
+        }
+    }
+
+
 class TestToolManager:
     """Test cases for the ToolManager class."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, base_config):
         """Set up test fixtures."""
-        # Create temporary files for testing
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.config_path = os.path.join(self.temp_dir.name, "config.json")
-        self.backup_path = os.path.join(self.temp_dir.name, "config.json.backup")
+        # Each test gets its own directory, so tests can run in parallel
+        self.temp_dir = tmp_path
+        self.config_path = os.path.join(tmp_path, "config.json")
+        self.backup_path = os.path.join(tmp_path, "config.json.backup")
         
-        # Create a test configuration
-        self.test_config = {
-            "mcpServers": {
-                "test-tool-1": {
-                    "command": "npx",
-                    "args": ["-y", "@test/tool-1"]
-                },
-                "test-tool-2": {
-                    "command": "npx",
-                    "args": ["-y", "@test/tool-2"],
-                    "env": {
-                        "TEST_VAR": "test-value"
-                    }
-                }
-            }
-        }
+        # Start from a copy of the shared test configuration
+        self.test_config = copy.deepcopy(base_config)
         
         # Write the test configuration to the file
-        with open(self.config_path, "w") as f:
-            json.dump(self.test_config, f)
+        Path(self.config_path).write_text(json.dumps(self.test_config))
         
         # Create the config manager and tool manager
         self.config_manager = ConfigManager(self.config_path)
         self.tool_manager = ToolManager(self.config_manager)
     
-    def teardown_method(self):
-        """Tear down test fixtures."""
-        self.temp_dir.cleanup()
-    
     def test_load_tools(self):
         """Test loading tools from configuration."""
         # Tools should be loaded in the constructor
@@ -94,6 +121,10 @@ class TestToolManager:
         config = self.config_manager.read_config()
         assert tool_name in config["mcpServers"]
         assert config["mcpServers"][tool_name] == tool_config
+        
+        # The tool should not share its configuration with the caller
+        tool_config["args"].append("--extra")
+        assert tool.config["args"] == ["-y", "@new/tool"]
     
     def test_update_tool(self):
         """Test updating an existing tool."""
@@ -224,3 +255,175 @@ class TestToolManager:
         assert not success
         assert error is not None
         assert len(added_tools) == 0
+    
+    def test_deferred_save(self):
+        """Test that saves inside deferred_save are written once at the end."""
+        writes = []
+        write_config = self.config_manager.write_config
+        self.config_manager.write_config = lambda config: (writes.append(config), write_config(config))
+        
+        with self.tool_manager.deferred_save():
+            self.tool_manager.add_tool("new-tool-1", {"command": "npx"})
+            self.tool_manager.add_tool("new-tool-2", {"command": "npx"})
+            assert writes == []
+        
+        assert len(writes) == 1
+        config = self.config_manager.read_config()
+        assert "new-tool-1" in config["mcpServers"]
+        assert "new-tool-2" in config["mcpServers"]
+    
+    def test_load_tools_unchanged(self):
+        """Test that reloading an unchanged configuration keeps the loaded tools."""
+        tool = self.tool_manager.get_tool("test-tool-1")
+        
+        self.tool_manager.load_tools()
+        assert self.tool_manager.get_tool("test-tool-1") is tool
+        
+        # Changing the file on disk should cause a reload
+        self.test_config["mcpServers"]["test-tool-3"] = {"command": "uvx"}
+        with open(self.config_path, "w") as f:
+            json.dump(self.test_config, f)
+        
+        self.tool_manager.load_tools()
+        assert self.tool_manager.get_tool("test-tool-1") is not tool
+        assert self.tool_manager.get_tool("test-tool-3") is not None
+        
+        # An edit that keeps the size and modification time needs a forced reload
+        tool = self.tool_manager.get_tool("test-tool-1")
+        stat = os.stat(self.config_path)
+        self.test_config["mcpServers"]["test-tool-1"]["command"] = "uvx"
+        with open(self.config_path, "w") as f:
+            json.dump(self.test_config, f)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        self.config_manager.invalidate()
+        self.tool_manager.load_tools()
+        assert self.tool_manager.get_tool("test-tool-1") is tool
+        
+        self.tool_manager.load_tools(force=True)
+        assert self.tool_manager.get_tool("test-tool-1").command == "uvx"
+    
+    def test_deferred_disable_writes_backup_once(self):
+        """Test that disabling several tools in a batch writes the backup at the end."""
+        with self.tool_manager.deferred_save():
+            self.tool_manager.disable_tool("test-tool-1")
+            self.tool_manager.disable_tool("test-tool-2")
+            assert not os.path.exists(self.backup_path)
+        
+        with open(self.backup_path, "r") as f:
+            backup = json.load(f)
+        
+        assert "test-tool-1" in backup["mcpServers"]
+        assert "test-tool-2" in backup["mcpServers"]
+        assert self.config_manager.read_config() == {"mcpServers": {}}
+    
+    def test_add_tools_from_config(self):
+        """Test adding tools from an already validated configuration."""
+        config = {"mcpServers": {"config-tool": {"command": "npx", "args": ["-y", "@config/tool"]}}}
+        
+        success, error, added_tools = self.tool_manager.add_tools_from_config(config)
+        
+        assert success
+        assert error is None
+        assert added_tools == ["config-tool"]
+        assert "config-tool" in self.config_manager.read_config()["mcpServers"]
+    
+    def test_debounced_save(self):
+        """Test that changes made with a Tk root are written once, later."""
+        root = FakeTkRoot()
+        tool_manager = ToolManager(self.config_manager, root)
+        
+        tool_manager.disable_tool("test-tool-1")
+        first_id, = root.callbacks
+        tool_manager.disable_tool("test-tool-2")
+        
+        # Each change pushes the save back, and nothing is written until it runs
+        assert len(root.callbacks) == 1
+        assert first_id not in root.callbacks
+        with open(self.config_path, "r") as f:
+            assert json.load(f) == self.test_config
+        
+        root.run_pending()
+        assert self.config_manager.read_config() == {"mcpServers": {}}
+        
+        # flush() writes a pending save immediately
+        tool_manager.enable_tool("test-tool-1")
+        tool_manager.flush()
+        assert root.callbacks == {}
+        assert "test-tool-1" in self.config_manager.read_config()["mcpServers"]
+    
+    def test_tool_fields(self):
+        """Test that a tool's command, args and env follow its configuration."""
+        tool = self.tool_manager.get_tool("test-tool-1")
+        tool_config = self.test_config["mcpServers"]["test-tool-1"]
+        assert tool.command == tool_config["command"]
+        assert tool.args == tuple(tool_config["args"])
+        assert tool.env == tool_config.get("env", {})
+        
+        self.tool_manager.update_tool("test-tool-1", {"command": "other", "env": {"KEY": "value"}})
+        assert tool.command == "other"
+        assert tool.args == ()
+        assert tool.env == {"KEY": "value"}
+    
+    def test_load_tools_hand_edited_args(self):
+        """Test that a server with non-list args doesn't cost the others."""
+        config = copy.deepcopy(self.test_config)
+        config["mcpServers"]["odd-tool"] = {"command": "npx", "args": 5}
+        Path(self.config_path).write_text(json.dumps(config))
+        self.config_manager.invalidate()
+        
+        tool_manager = ToolManager(self.config_manager)
+        assert tool_manager.get_tool("odd-tool").args == 5
+        
+        # Saving writes the hand-edited entry back unchanged with the others
+        tool_manager.add_tool("new-tool", {"command": "uvx"})
+        servers = self.config_manager.read_config()["mcpServers"]
+        assert set(servers) == {"test-tool-1", "test-tool-2", "odd-tool", "new-tool"}
+        assert servers["odd-tool"] == {"command": "npx", "args": 5}
+    
+    def test_load_tools_non_object_entry(self):
+        """Test that a server entry that isn't an object doesn't cost the others."""
+        config = copy.deepcopy(self.test_config)
+        config["mcpServers"]["null-tool"] = None
+        config["mcpServers"]["string-tool"] = "x"
+        Path(self.config_path).write_text(json.dumps(config))
+        self.config_manager.invalidate()
+        
+        tool_manager = ToolManager(self.config_manager)
+        assert len(tool_manager.get_tools()) == 4
+        assert tool_manager.get_tool("null-tool").args == ()
+        
+        # Saving writes the entries back unchanged with the others
+        tool_manager.add_tool("new-tool", {"command": "uvx"})
+        servers = self.config_manager.read_config()["mcpServers"]
+        assert set(servers) == {"test-tool-1", "test-tool-2", "null-tool", "string-tool", "new-tool"}
+        assert servers["null-tool"] is None
+        assert servers["string-tool"] == "x"
+    
+    def test_version(self):
+        """Test that the version changes with the tools and only then."""
+        version = self.tool_manager.version
+        
+        # No-op changes and an unchanged reload keep the version
+        self.tool_manager.enable_tool("test-tool-1")
+        self.tool_manager.update_tool("test-tool-2", self.test_config["mcpServers"]["test-tool-2"])
+        self.tool_manager.load_tools()
+        assert self.tool_manager.version == version
+        
+        self.tool_manager.disable_tool("test-tool-1")
+        assert self.tool_manager.version != version
+        
+        version = self.tool_manager.version
+        self.tool_manager.update_tool("test-tool-2", {"command": "updated-command", "args": []})
+        assert self.tool_manager.version != version
+    
+    def test_update_tool_unchanged(self):
+        """Test that updating a tool with its current configuration doesn't save."""
+        writes = []
+        self.config_manager.write_config = writes.append
+        
+        config = dict(self.test_config["mcpServers"]["test-tool-1"])
+        success = self.tool_manager.update_tool("test-tool-1", config)
+        
+        assert success
+        assert writes == []
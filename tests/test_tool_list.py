@@ -0,0 +1,187 @@
+"""Tests for the tool list's detail rendering and row layout."""
+
+import itertools
+import json
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+from mcp_tool_selector.config_manager import ConfigManager
+from mcp_tool_selector.tool_manager import Tool, ToolManager
+from mcp_tool_selector.ui.tool_list import ROW_PADX, ROW_PADY, ToolListFrame, _format_details, _tool_details
+
+# Enough tools that only some of the rows are built
+TOOL_COUNT = 40
+
+
+@pytest.fixture
+def tk_root():
+    """A Tk root window, skipping the test when there is no display."""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"No display available: {e}")
+    root.geometry("600x400")
+    yield root
+    root.destroy()
+
+
+class TestToolDetails:
+    """Test cases for rendering a tool's detail lines."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        _format_details.cache_clear()
+    
+    def test_cached_details(self):
+        """Test that hashable configurations are rendered once and cached."""
+        tool = Tool("test-tool", {"command": "npx", "args": ["-y", "@test/tool"], "env": {"TEST_VAR": "test-value"}})
+        
+        details = _tool_details(tool)
+        assert details == ("Command: npx", "Args: -y @test/tool", ("  TEST_VAR: test-value",))
+        assert _tool_details(tool) == details
+        assert _format_details.cache_info().hits == 1
+        
+        key = ("npx", ("-y", "@test/tool"), (("TEST_VAR", "test-value"),))
+        assert _format_details.__wrapped__(key) == details
+    
+    def test_unhashable_details(self):
+        """Test that nested values are rendered without the cache, the same way."""
+        tool = Tool("test-tool", {"command": "npx", "args": ["-y", {"key": 1}], "env": {"TEST_VAR": ["a", "b"]}})
+        
+        details = _tool_details(tool)
+        assert details == ("Command: npx", "Args: -y {'key': 1}", ("  TEST_VAR: ['a', 'b']",))
+        assert _format_details.cache_info().currsize == 0
+        
+        key = ("npx", ("-y", {"key": 1}), (("TEST_VAR", ["a", "b"]),))
+        assert _format_details.__wrapped__(key) == details
+    
+    def test_hand_edited_details(self):
+        """Test that args and env of the wrong type still render."""
+        tool = Tool("test-tool", {"command": "npx", "args": 5, "env": "x"})
+        
+        assert _tool_details(tool) == ("Command: npx", "Args: 5", ())
+
+
+class TestToolListLayout:
+    """Test cases for the virtualized row layout of the tool list."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, tk_root):
+        """Set up test fixtures."""
+        config = {"mcpServers": {
+            f"tool-{i}": {"command": "npx", "args": ["-y", f"@test/tool-{i}"]}
+            for i in range(TOOL_COUNT)
+        }}
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+        
+        self.root = tk_root
+        self.tool_manager = ToolManager(ConfigManager(str(config_path)))
+        self.frame = ToolListFrame(tk_root, self.tool_manager, lambda: None)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.settle()
+    
+    def settle(self):
+        """Run the pending relayouts and measurements."""
+        for _ in range(3):
+            self.root.update()
+    
+    def scroll_to(self, fraction):
+        """Scroll the list and let the rows follow."""
+        self.frame.canvas.yview_moveto(fraction)
+        self.frame._schedule_relayout()
+        self.settle()
+    
+    def remove(self, name):
+        """Remove a tool the way the row's remove button does, without asking."""
+        self.tool_manager.remove_tool(name)
+        self.frame._remove_row(name)
+        self.settle()
+    
+    def assert_layout(self):
+        """Check the row bookkeeping against the tool manager and the canvas."""
+        frame = self.frame
+        names = [tool.name for tool in self.tool_manager.get_tools()]
+        assert [tool.name for tool in frame._tools] == names
+        assert frame._positions == {name: i for i, name in enumerate(names)}
+        assert len(frame._heights) == len(names)
+        assert frame._offsets == list(itertools.accumulate(frame._heights, initial=0))
+        
+        # The built rows show their own tools where the offsets put them
+        for index, row in frame._live_rows.items():
+            assert row.tool is frame._tools[index]
+            assert frame.canvas.coords(row.window) == [ROW_PADX, frame._offsets[index] + ROW_PADY]
+        
+        # Every row in the viewport is built, and the built rows are contiguous
+        top = frame.canvas.canvasy(0)
+        bottom = top + frame.canvas.winfo_height()
+        visible = [
+            i for i in range(len(names))
+            if frame._offsets[i] < bottom and frame._offsets[i + 1] > top
+        ]
+        assert set(visible) <= set(frame._live_rows)
+        live = sorted(frame._live_rows)
+        assert live == list(range(live[0], live[-1] + 1))
+    
+    def test_initial_layout(self):
+        """Test that only the rows near the viewport are built."""
+        self.assert_layout()
+        assert 0 in self.frame._live_rows
+        assert len(self.frame._live_rows) < TOOL_COUNT
+    
+    def test_scrolled_layout(self):
+        """Test that scrolling builds the newly visible rows and drops the others."""
+        self.scroll_to(0.5)
+        self.assert_layout()
+        assert 0 not in self.frame._live_rows
+        
+        self.scroll_to(1.0)
+        self.assert_layout()
+        assert TOOL_COUNT - 1 in self.frame._live_rows
+    
+    def test_remove_first_row(self):
+        """Test removing the first row moves the others up a place."""
+        second = self.frame._live_rows[1].tool
+        
+        self.remove("tool-0")
+        self.assert_layout()
+        assert self.frame._live_rows[0].tool is second
+    
+    def test_remove_middle_row(self):
+        """Test removing a built row in the middle of the built range."""
+        live = sorted(self.frame._live_rows)
+        index = live[len(live) // 2]
+        following = self.frame._live_rows[index + 1].tool
+        
+        self.remove(self.frame._tools[index].name)
+        self.assert_layout()
+        assert self.frame._live_rows[index].tool is following
+    
+    def test_remove_unbuilt_row(self):
+        """Test removing a row that hasn't been built keeps the built ones."""
+        built = {index: row.tool for index, row in self.frame._live_rows.items()}
+        
+        self.remove("tool-30")
+        self.assert_layout()
+        assert {index: row.tool for index, row in self.frame._live_rows.items()} == built
+    
+    def test_remove_last_row(self):
+        """Test removing the last row while it is in view."""
+        self.scroll_to(1.0)
+        
+        self.remove(f"tool-{TOOL_COUNT - 1}")
+        self.assert_layout()
+        assert TOOL_COUNT - 2 in self.frame._live_rows
+    
+    def test_remove_all_rows(self):
+        """Test that removing the last tool shows the placeholder."""
+        for i in range(TOOL_COUNT):
+            self.remove(f"tool-{i}")
+        
+        assert self.frame._tools == []
+        assert self.frame._live_rows == {}
+        assert self.frame._offsets == [0]
+        assert self.frame._no_tools_frame is not None
+        assert self.frame.canvas.find_withtag("no_tools")